@@ -1,12 +1,14 @@
 from fastapi import FastAPI
-from pydantic import BaseModel
-from typing import Dict
-import pandas as pd
-import joblib
-import json
+from pydantic import BaseModel, ConfigDict, create_model
+from typing import Dict, List
+import numpy as np
 import csv
+import math
+import atexit
+import queue
+import threading
+import time
 from pathlib import Path
-from datetime import datetime
 
 # =====================================================
 # APP INITIALIZATION
@@ -22,8 +24,7 @@ app = FastAPI(
 # =====================================================
 BASE_DIR = Path(__file__).resolve().parents[1]
 
-MODEL_PATH = BASE_DIR / "model" / "fraud_logistic_model.pkl"
-FEATURE_PATH = BASE_DIR / "model" / "feature_list.json"
+MODEL_PATH = BASE_DIR / "model" / "fraud_logistic_model.npz"
 LOG_FILE = BASE_DIR / "monitoring" / "transaction_logs.csv"
 
 LOG_FILE.parent.mkdir(exist_ok=True)
@@ -31,10 +32,36 @@ LOG_FILE.parent.mkdir(exist_ok=True)
 # =====================================================
 # LOAD MODEL & FEATURES
 # =====================================================
-model = joblib.load(MODEL_PATH)
+# The artifact holds only {W, b, features}: logistic inference is just
+# sigmoid(W·x + b), so serving needs NumPy, not sklearn or the pickle
+_model = np.load(MODEL_PATH)
 
-with open(FEATURE_PATH, "r") as f:
-    FEATURE_LIST = json.load(f)
+_W = _model["W"].astype(np.float64)
+_B = float(_model["b"][0])
+FEATURE_LIST = _model["features"].tolist()
+
+FEATURE_INDEX = {name: j for j, name in enumerate(FEATURE_LIST)}
+FEATURE_SET = frozenset(FEATURE_LIST)
+
+# =====================================================
+# SCORING KERNEL (NUMBA-COMPILED WHEN AVAILABLE)
+# =====================================================
+try:
+    from numba import njit
+
+    @njit(cache=True, fastmath=True)
+    def _score(x, W, b):
+        s = b
+        for j in range(W.shape[0]):
+            s += W[j] * x[j]
+        return 1.0 / (1.0 + math.exp(-s))
+
+    # Warm the compilation cache at startup so the first request pays nothing
+    _score(np.zeros(len(FEATURE_LIST)), _W, _B)
+
+except ImportError:
+    def _score(x, W, b):
+        return 1.0 / (1.0 + math.exp(-(float(W.dot(x)) + b)))
 
 # =====================================================
 # DECISION THRESHOLDS (FINALIZED)
@@ -42,68 +69,100 @@ with open(FEATURE_PATH, "r") as f:
 REVIEW_THRESHOLD = 0.90
 BLOCK_THRESHOLD = 0.993
 
+# searchsorted(side="right") over the threshold array implements the same
+# ">= threshold" tiers without branching, for one probability or a batch
+_THRESHOLDS = np.array([REVIEW_THRESHOLD, BLOCK_THRESHOLD])
+_LABELS = np.array(["ALLOW", "REVIEW", "BLOCK"])
+
 # =====================================================
 # REQUEST / RESPONSE SCHEMAS
 # =====================================================
+# One explicit float field per model feature, generated from FEATURE_LIST,
+# so pydantic-core validates the whole record in Rust; extra="forbid" makes
+# missing and unexpected features schema errors rather than Python checks
+TransactionFeatures = create_model(
+    "TransactionFeatures",
+    __config__=ConfigDict(extra="forbid"),
+    **{name: (float, ...) for name in FEATURE_LIST}
+)
+
 class TransactionRequest(BaseModel):
-    features: Dict[str, float]
+    features: TransactionFeatures
+
+class BatchRequest(BaseModel):
+    transactions: List[Dict[str, float]]
 
 class PredictionResponse(BaseModel):
     fraud_probability: float
     decision: str
 
+class BatchPredictionResponse(BaseModel):
+    fraud_probabilities: List[float]
+    decisions: List[str]
+
 # =====================================================
-# LOGGING FUNCTION (PERSISTENT)
+# LOGGING (PERSISTENT, BUFFERED)
 # =====================================================
-def log_transaction(probability: float, decision: str):
-    write_header = not LOG_FILE.exists()
+# One file handle for the process lifetime: no per-request stat/open/close
+_LOG_FH = open(LOG_FILE, "a", buffering=65536, newline="")
+if _LOG_FH.tell() == 0:
+    _LOG_FH.write("timestamp,fraud_probability,decision\n")
+    _LOG_FH.flush()
+_LOG_WRITER = csv.writer(_LOG_FH)
 
-    with open(LOG_FILE, "a", newline="") as f:
-        writer = csv.writer(f)
-        if write_header:
-            writer.writerow(["timestamp", "fraud_probability", "decision"])
-        writer.writerow([
-            datetime.now().isoformat(),
-            round(float(probability), 6),
-            decision
-        ])
+atexit.register(_LOG_FH.flush)
 
-# =====================================================
-# PREPROCESS INPUT
-# =====================================================
-def preprocess_input(features: Dict[str, float]) -> pd.DataFrame:
-    df = pd.DataFrame([features])
+# Requests only enqueue; a daemon thread drains the queue in batches so
+# each disk write covers many transactions instead of one
+_LOG_QUEUE = queue.SimpleQueue()
+_LOG_BATCH_MAX = 1000
 
-    missing = set(FEATURE_LIST) - set(df.columns)
-    extra = set(df.columns) - set(FEATURE_LIST)
+def _drain_log_queue():
+    while True:
+        batch = [_LOG_QUEUE.get()]
+        while len(batch) < _LOG_BATCH_MAX and not _LOG_QUEUE.empty():
+            batch.append(_LOG_QUEUE.get_nowait())
+        _LOG_WRITER.writerows(batch)
+        _LOG_FH.flush()
 
-    if missing:
-        raise ValueError(f"Missing features: {missing}")
-    if extra:
-        raise ValueError(f"Unexpected features: {extra}")
+threading.Thread(target=_drain_log_queue, daemon=True).start()
 
-    return df[FEATURE_LIST]
+def log_transaction(probability: float, decision: str):
+    # Raw nanosecond ticks: ISO formatting is deferred to the dashboard,
+    # which reads every few seconds instead of per transaction
+    _LOG_QUEUE.put((
+        time.time_ns(),
+        round(float(probability), 6),
+        decision
+    ))
+
+# =====================================================
+# PREPROCESS INPUT
+# =====================================================
+def preprocess_input(features: Dict[str, float]) -> np.ndarray:
+    return np.fromiter(
+        (features[name] for name in FEATURE_LIST),
+        dtype=np.float64,
+        count=len(FEATURE_LIST)
+    )
 
 # =====================================================
 # DECISION LOGIC
 # =====================================================
 def make_decision(probability: float) -> str:
-    if probability >= BLOCK_THRESHOLD:
-        return "BLOCK"
-    elif probability >= REVIEW_THRESHOLD:
-        return "REVIEW"
-    else:
-        return "ALLOW"
+    return str(_LABELS[np.searchsorted(_THRESHOLDS, probability, side="right")])
 
 # =====================================================
 # PREDICTION ENDPOINT
 # =====================================================
 @app.post("/predict", response_model=PredictionResponse)
-def predict_fraud(transaction: TransactionRequest):
+async def predict_fraud(transaction: TransactionRequest):
+    # Scoring is a microsecond kernel and logging only enqueues, so the
+    # whole handler runs inline on the event loop — no threadpool hop
     try:
-        X = preprocess_input(transaction.features)
+        x = preprocess_input(transaction.features.__dict__)
 
-        fraud_probability = model.predict_proba(X)[0, 1]
+        fraud_probability = _score(x, _W, _B)
         decision = make_decision(fraud_probability)
 
         # 🔴 PERSIST LOG
@@ -117,11 +176,49 @@ def predict_fraud(transaction: TransactionRequest):
     except Exception as e:
         return {"error": str(e)}
 
+# =====================================================
+# BATCH PREDICTION ENDPOINT
+# =====================================================
+@app.post("/predict_batch", response_model=BatchPredictionResponse)
+async def predict_fraud_batch(batch: BatchRequest):
+    try:
+        n = len(batch.transactions)
+        X = np.empty((n, len(FEATURE_LIST)), dtype=np.float32)
+
+        for i, tx in enumerate(batch.transactions):
+            # dict key views compare against the prebuilt frozenset directly,
+            # with no per-transaction set construction
+            missing = FEATURE_SET - tx.keys()
+            extra = tx.keys() - FEATURE_SET
+            if missing:
+                raise ValueError(f"Transaction {i} missing features: {missing}")
+            if extra:
+                raise ValueError(f"Transaction {i} unexpected features: {extra}")
+            for name, value in tx.items():
+                X[i, FEATURE_INDEX[name]] = value
+
+        # One vectorized sigmoid(X·W + b) over the whole batch — microseconds
+        # even for thousands of rows, so it runs inline on the event loop
+        probs = 1.0 / (1.0 + np.exp(-(X @ _W + _B)))
+
+        decisions = _LABELS[np.searchsorted(_THRESHOLDS, probs, side="right")]
+
+        for probability, decision in zip(probs, decisions):
+            log_transaction(probability, decision)
+
+        return {
+            "fraud_probabilities": [round(float(p), 6) for p in probs],
+            "decisions": decisions.tolist()
+        }
+
+    except Exception as e:
+        return {"error": str(e)}
+
 # =====================================================
 # HEALTH CHECK
 # =====================================================
 @app.get("/health")
-def health():
+async def health():
     return {
         "status": "OK",
         "model_loaded": True,
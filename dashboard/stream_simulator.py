@@ -0,0 +1,133 @@
+import streamlit as st
+import pandas as pd
+import numpy as np
+import requests
+import joblib
+import json
+import time
+from pathlib import Path
+
+# =====================================================
+# CONFIG
+# =====================================================
+API_URL = "http://localhost:8000/predict"
+BATCH_SIZE = 32            # rows per POST
+STREAM_INTERVAL = 1.0      # seconds between batches
+
+# =====================================================
+# PATHS (CLOUD SAFE)
+# =====================================================
+BASE_DIR = Path(__file__).resolve().parents[1]
+DATA_PATH = BASE_DIR / "data" / "raw" / "creditcard.csv"
+SCALER_PATH = BASE_DIR / "model" / "scaler.pkl"
+FEATURE_PATH = BASE_DIR / "model" / "feature_list.json"
+
+# =====================================================
+# LOAD ARTIFACTS
+# =====================================================
+scaler = joblib.load(SCALER_PATH)
+
+with open(FEATURE_PATH, "r") as f:
+    FEATURE_LIST = json.load(f)
+
+# One pooled session for the whole app: TCP connection and HTTP keep-alive
+# are reused across batches instead of a fresh handshake per POST
+_SESSION = requests.Session()
+
+# =====================================================
+# PAGE SETUP
+# =====================================================
+st.set_page_config(
+    page_title="Transaction Stream Simulator",
+    layout="wide"
+)
+
+st.markdown("## 📡 Transaction Stream Simulator")
+st.markdown(
+    f"**Replaying historical transactions** ┆ batch size {BATCH_SIZE} "
+    f"┆ every {STREAM_INTERVAL}s"
+)
+
+# =====================================================
+# LOAD SOURCE DATA
+# =====================================================
+if not DATA_PATH.exists():
+    st.error(f"Source dataset not found: {DATA_PATH}")
+    st.stop()
+
+# Parsed once per process and shared read-only across sessions/reruns —
+# the ~150 MB CSV is never re-read just to slice the next batch. float32
+# halves the resident footprint and the pyarrow engine parses multithreaded.
+@st.cache_resource(show_spinner="Loading source dataset...")
+def load_source() -> pd.DataFrame:
+    return pd.read_csv(DATA_PATH, dtype="float32", engine="pyarrow")
+
+df = load_source()
+
+# =====================================================
+# FEATURE PREPARATION (MATCHES TRAINING PIPELINE)
+# =====================================================
+def prepare_block(block: pd.DataFrame) -> list:
+    # One scaler.transform over the whole block and one vectorized Hour
+    # computation, instead of a 1x1 sklearn call per row
+    scaled = scaler.transform(block[["Amount"]].to_numpy())[:, 0]
+    hours = (block["Time"].to_numpy() // 3600) % 24
+    values = np.concatenate(
+        [
+            block[FEATURE_LIST[:28]].to_numpy(),
+            scaled[:, None],
+            hours[:, None]
+        ],
+        axis=1
+    )
+    return [
+        dict(zip(FEATURE_LIST, map(float, row_values)))
+        for row_values in values
+    ]
+
+# =====================================================
+# STREAM ONE BATCH PER RERUN
+# =====================================================
+if "stream_idx" not in st.session_state:
+    st.session_state.stream_idx = 0
+
+idx = st.session_state.stream_idx
+block = df.iloc[idx:idx + BATCH_SIZE]
+
+if block.empty:
+    st.success("✅ Stream complete — all transactions replayed.")
+    st.stop()
+
+payload = {"transactions": prepare_block(block)}
+
+# One POST scores the whole batch: TCP setup and HTTP framing are paid
+# once per BATCH_SIZE transactions, not once per row
+response = _SESSION.post(f"{API_URL}_batch", json=payload, timeout=10)
+result = response.json()
+
+st.session_state.stream_idx = idx + len(block)
+
+# =====================================================
+# BATCH SUMMARY
+# =====================================================
+k1, k2, k3 = st.columns(3)
+k1.metric("Transactions Sent", st.session_state.stream_idx)
+k2.metric("Batch Size", len(block))
+
+decisions = result.get("decisions", [])
+flagged = sum(1 for d in decisions if d != "ALLOW")
+k3.metric("Flagged In Batch", flagged)
+
+st.dataframe(
+    pd.DataFrame({
+        "fraud_probability": result.get("fraud_probabilities", []),
+        "decision": decisions
+    }),
+    use_container_width=True
+)
+
+# =====================================================
+# AUTO REFRESH (STREAMLIT-CLOUD SAFE)
+# =====================================================
+time.sleep(STREAM_INTERVAL)
+st.rerun()